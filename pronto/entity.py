@@ -50,7 +50,7 @@ class Entity:
     if __debug__ or typing.TYPE_CHECKING:
 
         __data: "weakref.ReferenceType[EntityData]"
-        __slots__: Iterable[str] = ("__weakref__",)
+        __slots__: Iterable[str] = ("__weakref__", "__data", "__id", "__ontology")
 
         def __init__(self, ontology: "Ontology", data: "EntityData"):
             self.__data = weakref.ref(data)
@@ -65,7 +65,7 @@ class Entity:
 
     else:
 
-        __slots__: Iterable[str] = ("__weakref__", "_data")
+        __slots__: Iterable[str] = ("__weakref__", "_data", "__id", "__ontology")
 
         def __init__(self, ontology: "Ontology", data: "EntityData"):
             self._data = weakref.ref(data)
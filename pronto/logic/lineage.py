@@ -43,7 +43,6 @@ class LineageIterator(Iterator["Term"]):
     _maxlen: int
     _ontology: "Ontology"
     _linked: Set[str]
-    _done: Set[str]
     _frontier: Deque[Tuple[str, int]]
     _queue: Deque[str]
 
@@ -69,7 +68,6 @@ class LineageIterator(Iterator["Term"]):
             self._maxlen = len(ont.terms())
 
         self._linked: Set[str] = set()
-        self._done: Set[str] = set()
         self._frontier: Deque[Tuple[str, int]] = collections.deque()
         self._queue: Deque[str] = collections.deque()
 
@@ -97,15 +95,16 @@ class LineageIterator(Iterator["Term"]):
                 return self._ontology.get_term(self._queue.popleft())
             # Get the next node in the frontier
             node, distance = self._frontier.popleft()
-            self._done.add(node)
-            # Process its neighbors if they are not too far
-            neighbors: Set[str] = set(self._get_neighbors(node))
+            # Process its neighbors if they are not too far: since the graph
+            # is explored breadth-first, a node is only added to the frontier
+            # the first time it is reached, with its shortest distance.
+            neighbors: Set[str] = self._get_neighbors(node)
             if neighbors and distance < self._distmax:
-                for node in sorted(neighbors.difference(self._done)):
-                    self._frontier.append((node, distance + 1))
-                for neighbor in sorted(neighbors.difference(self._linked)):
-                    self._linked.add(neighbor)
-                    self._queue.append(neighbor)
+                for neighbor in sorted(neighbors):
+                    if neighbor not in self._linked:
+                        self._linked.add(neighbor)
+                        self._queue.append(neighbor)
+                        self._frontier.append((neighbor, distance + 1))
         # Stop iteration if no more elements to process
         raise StopIteration
 
@@ -130,7 +129,10 @@ class SubclassesIterator(LineageIterator):
     """
 
     def _get_neighbors(self, node: str) -> Set[str]:
-        return self._ontology._inheritance.get(node, Lineage()).sub
+        try:
+            return self._ontology._inheritance[node].sub
+        except KeyError:
+            return set()
 
 
 class SuperclassesIterator(LineageIterator):
@@ -138,4 +140,7 @@ class SuperclassesIterator(LineageIterator):
     """
 
     def _get_neighbors(self, node: str) -> Set[str]:
-        return self._ontology._inheritance.get(node, Lineage()).sup
+        try:
+            return self._ontology._inheritance[node].sup
+        except KeyError:
+            return set()
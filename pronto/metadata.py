@@ -140,7 +140,7 @@ class Metadata(object):
         self.date = date
         self.default_namespace = default_namespace
         self.namespace_id_rule = namespace_id_rule
-        self.owl_axioms = owl_axioms or list()
+        self.owl_axioms = list() if owl_axioms is None else owl_axioms
         self.saved_by = saved_by
         self.auto_generated_by = auto_generated_by
         self.subsetdefs = set(subsetdefs) if subsetdefs is not None else set()
@@ -148,9 +148,9 @@ class Metadata(object):
         self.synonymtypedefs = (
             set(synonymtypedefs) if synonymtypedefs is not None else set()
         )
-        self.idspaces = idspaces or dict()
-        self.remarks = remarks or set()
-        self.annotations = annotations or set()
+        self.idspaces = dict() if idspaces is None else idspaces
+        self.remarks = set() if remarks is None else remarks
+        self.annotations = set() if annotations is None else annotations
         self.unreserved = unreserved
 
     def __bool__(self) -> bool:
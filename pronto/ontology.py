@@ -1,6 +1,8 @@
+import collections
 import contextlib
 import itertools
 import io
+import sys
 import typing
 from typing import BinaryIO, Dict, Mapping, Optional, Set, Union
 
@@ -117,6 +119,14 @@ class Ontology(Mapping[str, Union[Term, Relationship]]):
             ValueError: When the given ``handle`` contains a serialized
                 ontology not supported by any of the builtin parsers.
 
+        Note:
+            When an ontology declares several imports, they are loaded
+            concurrently using a pool of threads. The pool uses at most as
+            many threads as there are CPUs (up to 16), unless overridden by
+            setting the ``PRONTO_THREADS`` environment variable to a positive
+            integer. Imports of imported ontologies are loaded sequentially
+            by the threads of that pool.
+
         """
         from .parsers import BaseParser
 
@@ -197,10 +207,10 @@ class Ontology(Mapping[str, Union[Term, Relationship]]):
     def __contains__(self, item: object) -> bool:
         if isinstance(item, str):
             return (
-                any(item in i for i in self.imports.values())
-                or item in self._terms
+                item in self._terms
                 or item in self._relationships
                 or item in relationship._BUILTINS
+                or any(item in i for i in self.imports.values())
             )
         return False
 
@@ -242,11 +252,18 @@ class Ontology(Mapping[str, Union[Term, Relationship]]):
     # --- Private helpers ----------------------------------------------------
 
     def _build_inheritance_cache(self) -> None:
+        inheritance: Dict[str, Lineage] = collections.defaultdict(Lineage)
+        termdatas = itertools.chain(
+            (t._data() for dep in self.imports.values() for t in dep.terms()),
+            self._terms.values(),
+        )
+        for termdata in termdatas:
+            superclasses = termdata.relationships.get("is_a", ())
+            inheritance[termdata.id].sup.update(superclasses)
+            for superclass in superclasses:
+                inheritance[superclass].sub.add(termdata.id)
         self._inheritance.clear()
-        for t1 in self.terms():
-            for t2 in t1._data().relationships.get("is_a", []):
-                self._inheritance.setdefault(t2, Lineage()).sub.add(t1.id)
-                self._inheritance.setdefault(t1.id, Lineage()).sup.add(t2)
+        self._inheritance.update(inheritance)
 
     # --- Serialization utils ------------------------------------------------
 
@@ -344,6 +361,7 @@ class Ontology(Mapping[str, Union[Term, Relationship]]):
         """
         if id in self:
             raise ValueError(f"identifier already in use: {id} ({self[id]})")
+        id = sys.intern(str(id))
         self._terms[id] = termdata = TermData(id)
         self._inheritance[id] = Lineage()
         return Term(self, termdata)
@@ -359,6 +377,7 @@ class Ontology(Mapping[str, Union[Term, Relationship]]):
         """
         if id in self:
             raise ValueError(f"identifier already in use: {id} ({self[id]})")
+        id = sys.intern(str(id))
         self._relationships[id] = reldata = RelationshipData(id)
         return Relationship(self, reldata)
 
@@ -1,4 +1,5 @@
 import functools
+import sys
 import typing
 import warnings
 from typing import Union
@@ -368,12 +369,12 @@ def _process_clause_typedef_inverse_of(clause, entity):
 
 @process_clause_term.register(fastobo.term.IsAClause)
 def _process_clause_term_is_a(clause, entity):
-    entity.relationships.setdefault("is_a", set()).add(str(clause.term))
+    entity.relationships.setdefault("is_a", set()).add(sys.intern(str(clause.term)))
 
 
 @process_clause_typedef.register(fastobo.typedef.IsAClause)
 def _process_clause_typedef_is_a(clause, entity):
-    entity.relationships.setdefault("is_a", set()).add(str(clause.typedef))
+    entity.relationships.setdefault("is_a", set()).add(sys.intern(str(clause.typedef)))
 
 
 @process_clause_term.register(fastobo.term.IsAnonymousClause)
@@ -469,12 +470,14 @@ def _process_clause_typedef_range(clause, entity):
 
 @process_clause_term.register(fastobo.term.RelationshipClause)
 def _process_clause_term_relationship(clause, entity):
-    entity.relationships.setdefault(str(clause.typedef), set()).add(str(clause.term))
+    r = sys.intern(str(clause.typedef))
+    entity.relationships.setdefault(r, set()).add(sys.intern(str(clause.term)))
 
 
 @process_clause_term.register(fastobo.typedef.RelationshipClause)
 def _process_clause_typedef_relationship(clause, entity):
-    entity.relationships.setdefault(str(clause.typedef), set()).add(str(clause.target))
+    r = sys.intern(str(clause.typedef))
+    entity.relationships.setdefault(r, set()).add(sys.intern(str(clause.target)))
 
 
 @process_clause_term.register(fastobo.term.ReplacedByClause)
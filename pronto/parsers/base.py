@@ -1,10 +1,21 @@
 import abc
 import os
+import threading
 import typing
 import urllib.parse
+import warnings
 from typing import Dict, Set
 
 from ..ontology import Ontology
+from ..utils.warnings import ProntoWarning
+
+# thread-local flag set in the threads of an import pool, so that nested
+# imports are loaded sequentially instead of spawning more pools
+_pool_state = threading.local()
+
+
+def _init_pool_worker() -> None:
+    _pool_state.worker = True
 
 
 class BaseParser(abc.ABC):
@@ -22,6 +33,26 @@ class BaseParser(abc.ABC):
     def parse_from(self, handle: typing.BinaryIO) -> None:
         return NotImplemented
 
+    @staticmethod
+    def _get_threads() -> int:
+        """Get the number of threads to use to load imports concurrently.
+        """
+        default = min(os.cpu_count() or 1, 16)
+        value = os.getenv("PRONTO_THREADS")
+        if value is None:
+            return default
+        try:
+            threads = int(value)
+        except ValueError:
+            threads = 0
+        if threads < 1:
+            warnings.warn(
+                f"invalid PRONTO_THREADS value: {value!r}, using {default} threads",
+                ProntoWarning,
+            )
+            return default
+        return threads
+
     @classmethod
     def process_imports(
         cls,
@@ -35,7 +66,8 @@ class BaseParser(abc.ABC):
         if import_depth == 0:
             return resolved
 
-        # process each import
+        # resolve the location of each import
+        urls: Dict[str, str] = {}
         for ref in imports:
             s = urllib.parse.urlparse(ref).scheme
             if s in {"ftp", "http", "https"} or os.path.exists(ref):
@@ -48,7 +80,24 @@ class BaseParser(abc.ABC):
                 else:
                     id_ = f"{ref}.obo" if not os.path.splitext(ref)[1] else ref
                     url = f"http://purl.obolibrary.org/obo/{id_}"
-            resolved[ref] = Ontology(url, max(import_depth - 1, 0), timeout)
+            urls[ref] = url
+
+        # load the imports, using threads since this is mostly network I/O
+        def load(url: str) -> Ontology:
+            return Ontology(url, max(import_depth - 1, 0), timeout)
+
+        if len(urls) > 1 and not getattr(_pool_state, "worker", False):
+            threads = min(cls._get_threads(), len(urls))
+        else:
+            threads = 1
+        if threads > 1:
+            from multiprocessing.pool import ThreadPool
+
+            with ThreadPool(threads, initializer=_init_pool_worker) as pool:
+                ontologies = pool.map(load, urls.values())
+        else:
+            ontologies = list(map(load, urls.values()))
 
         # return the resolved imports
+        resolved.update(zip(urls.keys(), ontologies))
         return resolved
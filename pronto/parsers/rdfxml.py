@@ -1,6 +1,7 @@
 import datetime
 import os
 import re
+import sys
 import typing
 import warnings
 from typing import Dict, List, Optional
@@ -65,6 +66,18 @@ _SYNONYMS_ATTRIBUTES = {
     _NS["oboInOwl"]["hasRelatedSynonym"]: "RELATED",
 }
 
+_CREATED_BY = frozenset({_NS["oboInOwl"]["created_by"], _NS["dc"]["creator"]})
+
+_CREATION_DATE = frozenset({_NS["oboInOwl"]["creation_date"], _NS["dc"]["date"]})
+
+_DEFAULT_NAMESPACE = frozenset(
+    {_NS["oboInOwl"]["default-namespace"], _NS["oboInOwl"]["hasDefaultNamespace"]}
+)
+
+_ID_ATTRIBUTES = frozenset({_NS["oboInOwl"]["id"], _NS["oboInOwl"]["shorthand"]})
+
+_SAVED_BY = frozenset({_NS["oboInOwl"]["saved-by"], _NS["oboInOwl"]["savedBy"]})
+
 
 class RdfXMLParser(BaseParser):
     """A parser for OWL2 ontologies serialized in RDF/XML format.
@@ -120,13 +133,13 @@ class RdfXMLParser(BaseParser):
         """
         match = re.match("^http://purl.obolibrary.org/obo/([^#_]+)_(.*)$", iri)
         if match is not None:
-            return ":".join(match.groups())
+            return sys.intern(":".join(match.groups()))
         if self.ont.metadata.ontology is not None:
             id_ = self.ont.metadata.ontology
             match = re.match(f"^http://purl.obolibrary.org/obo/{id_}#(.*)$", iri)
             if match is not None:
-                return match.group(1)
-        return iri
+                return sys.intern(match.group(1))
+        return sys.intern(iri)
 
     def _compact_datatype(self, iri: str) -> str:
         match = re.match("^http://www.w3.org/2001/XMLSchema#(.*)$", iri)
@@ -173,14 +186,11 @@ class RdfXMLParser(BaseParser):
                 meta.remarks.add(child.text)
             elif child.tag == _NS["oboInOwl"]["hasOBOFormatVersion"]:
                 meta.format_version = child.text
-            elif child.tag in (_NS["oboInOwl"]["saved-by"], _NS["oboInOwl"]["savedBy"]):
+            elif child.tag in _SAVED_BY:
                 meta.saved_by = child.text
             elif child.tag == _NS["oboInOwl"]["auto-generated-by"]:
                 meta.auto_generated_by = child.text
-            elif child.tag in (
-                _NS["oboInOwl"]["default-namespace"],
-                _NS["oboInOwl"]["hasDefaultNamespace"],
-            ):
+            elif child.tag in _DEFAULT_NAMESPACE:
                 meta.default_namespace = child.text
             elif child.tag == _NS["oboInOwl"]["date"]:
                 meta.date = datetime.datetime.strptime(child.text, "%d:%m:%Y %H:%M")
@@ -261,9 +271,9 @@ class RdfXMLParser(BaseParser):
                     )
             elif tag == _NS["rdfs"]["comment"] and text is not None:
                 comments.append(text)
-            elif tag in (_NS["oboInOwl"]["created_by"], _NS["dc"]["creator"]):
+            elif tag in _CREATED_BY:
                 termdata.created_by = text
-            elif tag in (_NS["oboInOwl"]["creation_date"], _NS["dc"]["date"]):
+            elif tag in _CREATION_DATE:
                 termdata.creation_date = dateutil.parser.parse(typing.cast(str, text))
             elif tag == _NS["oboInOwl"]["hasOBONamespace"]:
                 if text != self.ont.metadata.default_namespace:
@@ -449,11 +459,9 @@ class RdfXMLParser(BaseParser):
                     reldata.inverse_functional = True
             elif tag == _NS["rdfs"]["comment"] and text is not None:
                 comments.append(text)
-            elif tag in (_NS["oboInOwl"]["created_by"], _NS["dc"]["creator"]):
+            elif tag in _CREATED_BY:
                 reldata.created_by = text
-            elif (
-                tag == _NS["oboInOwl"]["creation_date"] or tag == _NS["dc"]["date"]
-            ) and text is not None:
+            elif tag in _CREATION_DATE and text is not None:
                 reldata.creation_date = dateutil.parser.parse(text)
             elif tag == _NS["oboInOwl"]["hasOBONamespace"]:
                 if text != self.ont.metadata.default_namespace:
@@ -518,7 +526,7 @@ class RdfXMLParser(BaseParser):
                         SyntaxWarning,
                         stacklevel=2,
                     )
-            elif tag not in (_NS["oboInOwl"]["id"], _NS["oboInOwl"]["shorthand"]):
+            elif tag not in _ID_ATTRIBUTES:
                 if _NS["rdf"]["resource"] in attrib:
                     reldata.annotations.add(self._extract_resource_pv(child))
                 elif _NS["rdf"]["datatype"] in attrib and text is not None:
@@ -115,17 +115,17 @@ class RelationshipData(EntityData):
         self.anonymous = anonymous
         self.name = name
         self.namespace = namespace
-        self.alternate_ids = alternate_ids or set()
+        self.alternate_ids = set() if alternate_ids is None else alternate_ids
         self.definition = definition
         self.comment = comment
-        self.subsets = subsets or set()
-        self.synonyms = synonyms or set()
-        self.xrefs = xrefs or set()
-        self.annotations = annotations or set()
+        self.subsets = set() if subsets is None else subsets
+        self.synonyms = set() if synonyms is None else synonyms
+        self.xrefs = set() if xrefs is None else xrefs
+        self.annotations = set() if annotations is None else annotations
         self.domain = domain
         self.range = range
         self.builtin = builtin
-        self.holds_over_chain = holds_over_chain or set()
+        self.holds_over_chain = set() if holds_over_chain is None else holds_over_chain
         self.antisymmetric = antisymmetric
         self.cyclic = cyclic
         self.reflexive = reflexive
@@ -134,22 +134,28 @@ class RelationshipData(EntityData):
         self.transitive = transitive
         self.functional = functional
         self.inverse_functional = inverse_functional
-        self.intersection_of = intersection_of or set()
-        self.union_of = union_of or set()
-        self.equivalent_to = equivalent_to or set()
-        self.disjoint_from = disjoint_from or set()
+        self.intersection_of = set() if intersection_of is None else intersection_of
+        self.union_of = set() if union_of is None else union_of
+        self.equivalent_to = set() if equivalent_to is None else equivalent_to
+        self.disjoint_from = set() if disjoint_from is None else disjoint_from
         self.inverse_of = inverse_of
-        self.transitive_over = transitive_over or set()
-        self.equivalent_to_chain = equivalent_to_chain or set()
-        self.disjoint_over = disjoint_over or set()
-        self.relationships = relationships or dict()
+        self.transitive_over = set() if transitive_over is None else transitive_over
+        self.equivalent_to_chain = (
+            set() if equivalent_to_chain is None else equivalent_to_chain
+        )
+        self.disjoint_over = set() if disjoint_over is None else disjoint_over
+        self.relationships = dict() if relationships is None else relationships
         self.obsolete = obsolete
         self.created_by = created_by
         self.creation_date = creation_date
-        self.replaced_by = replaced_by or set()
-        self.consider = consider or set()
-        self.expand_assertion_to = expand_assertion_to or set()
-        self.expand_expression_to = expand_expression_to or set()
+        self.replaced_by = set() if replaced_by is None else replaced_by
+        self.consider = set() if consider is None else consider
+        self.expand_assertion_to = (
+            set() if expand_assertion_to is None else expand_assertion_to
+        )
+        self.expand_expression_to = (
+            set() if expand_expression_to is None else expand_expression_to
+        )
         self.metadata_tag = metadata_tag
         self.class_level = class_level
 
@@ -162,6 +168,8 @@ class Relationship(Entity):
     or ``AnnotationProperty``) in OWL2.
     """
 
+    __slots__ = ()
+
     if typing.TYPE_CHECKING:
 
         def __init__(self, ontology: "Ontology", reldata: "RelationshipData"):
@@ -1,4 +1,5 @@
 import abc
+import functools
 import io
 import os
 import operator
@@ -16,6 +17,13 @@ from ..xref import Xref
 from ..pv import PropertyValue, LiteralPropertyValue, ResourcePropertyValue
 
 
+@functools.lru_cache(maxsize=4096)
+def _parse_id(id: str) -> fastobo.id.BaseIdent:
+    # identifiers such as relationship types or common superclasses occur in
+    # many frames, so reuse the parsed value instead of parsing each time
+    return fastobo.id.parse(id)
+
+
 class FastoboSerializer:
 
     ont: Ontology
@@ -50,13 +58,13 @@ class FastoboSerializer:
         for subset in sorted(m.subsetdefs):
             frame.append(
                 fastobo.header.SubsetdefClause(
-                    subset=fastobo.id.parse(subset.name), description=subset.description
+                    subset=_parse_id(subset.name), description=subset.description
                 )
             )
         for syn in sorted(m.synonymtypedefs):
             frame.append(
                 fastobo.header.SynonymTypedefClause(
-                    typedef=fastobo.id.parse(syn.id),
+                    typedef=_parse_id(syn.id),
                     description=syn.description,
                     scope=syn.scope,
                 )
@@ -86,34 +94,34 @@ class FastoboSerializer:
         try:
             pv = typing.cast(ResourcePropertyValue, pv)
             return fastobo.pv.ResourcePropertyValue(
-                fastobo.id.parse(pv.property), fastobo.id.parse(pv.resource),
+                _parse_id(pv.property), _parse_id(pv.resource),
             )
         except AttributeError:
             pv = typing.cast(LiteralPropertyValue, pv)
             return fastobo.pv.LiteralPropertyValue(
-                fastobo.id.parse(pv.property), pv.literal, fastobo.id.parse(pv.datatype)
+                _parse_id(pv.property), pv.literal, _parse_id(pv.datatype)
             )
 
     def _to_synonym(self, syn: SynonymData) -> fastobo.syn.Synonym:
         return fastobo.syn.Synonym(
             syn.description,
             syn.scope,
-            None if syn.type is None else fastobo.id.parse(syn.type),
+            None if syn.type is None else _parse_id(syn.type),
             map(self._to_xref, syn.xrefs),
         )
 
     def _to_term_frame(self, t: TermData) -> fastobo.term.TermFrame:
-        frame = fastobo.term.TermFrame(fastobo.id.parse(t.id))
+        frame = fastobo.term.TermFrame(_parse_id(t.id))
         if t.anonymous:
             frame.append(fastobo.term.IsAnonymousClause(True))
         if t.name is not None:
             frame.append(fastobo.term.NameClause(t.name))
         if t.namespace is not None:
             if t.namespace != self.ont.metadata.default_namespace:
-                ns = fastobo.id.parse(t.namespace)
+                ns = _parse_id(t.namespace)
                 frame.append(fastobo.term.NamespaceClause(ns))
         for alt in sorted(t.alternate_ids):
-            frame.append(fastobo.term.AltIdClause(fastobo.id.parse(alt)))
+            frame.append(fastobo.term.AltIdClause(_parse_id(alt)))
         if t.definition is not None:
             frame.append(
                 fastobo.term.DefClause(
@@ -124,7 +132,7 @@ class FastoboSerializer:
         if t.comment is not None:
             frame.append(fastobo.term.CommentClause(t.comment))
         for subset in sorted(t.subsets):
-            frame.append(fastobo.term.SubsetClause(fastobo.id.parse(subset)))
+            frame.append(fastobo.term.SubsetClause(_parse_id(subset)))
         for syn in sorted(t.synonyms):
             frame.append(fastobo.term.SynonymClause(self._to_synonym(syn)))
         for xref in sorted(t.xrefs):
@@ -134,26 +142,26 @@ class FastoboSerializer:
         for pv in sorted(t.annotations):
             frame.append(fastobo.term.PropertyValueClause(self._to_property_value(pv)))
         for superclass in sorted(t.relationships.get("is_a", ())):
-            frame.append(fastobo.term.IsAClause(fastobo.id.parse(superclass)))
+            frame.append(fastobo.term.IsAClause(_parse_id(superclass)))
         for i in sorted(filter(lambda x: not isinstance(x, tuple), t.intersection_of)):
-            frame.append(fastobo.term.IntersectionOfClause(term=fastobo.id.parse(i)))
+            frame.append(fastobo.term.IntersectionOfClause(term=_parse_id(i)))
         for (i, j) in sorted(filter(lambda x: isinstance(x, tuple), t.intersection_of)):
             frame.append(
                 fastobo.term.IntersectionOfClause(
-                    typedef=fastobo.id.parse(i), term=fastobo.id.parse(j)
+                    typedef=_parse_id(i), term=_parse_id(j)
                 )
             )
         for id_ in sorted(t.union_of):
-            frame.append(fastobo.term.UnionOfClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.term.UnionOfClause(_parse_id(id_)))
         for id_ in sorted(t.equivalent_to):
-            frame.append(fastobo.term.EquivalentToClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.term.EquivalentToClause(_parse_id(id_)))
         for id_ in sorted(t.disjoint_from):
-            frame.append(fastobo.term.DisjointFromClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.term.DisjointFromClause(_parse_id(id_)))
         for r, values in t.relationships.items():
             if r != "is_a":
-                r_id = fastobo.id.parse(r)
+                r_id = _parse_id(r)
                 for value in values:
-                    t_id = fastobo.id.parse(value)
+                    t_id = _parse_id(value)
                     frame.append(fastobo.term.RelationshipClause(r_id, t_id))
         if t.created_by is not None:
             frame.append(fastobo.term.CreatedByClause(t.created_by))
@@ -162,23 +170,23 @@ class FastoboSerializer:
         if t.obsolete:
             frame.append(fastobo.term.IsObsoleteClause(True))
         for r in sorted(t.replaced_by):
-            frame.append(fastobo.term.ReplacedByClause(fastobo.id.parse(r)))
+            frame.append(fastobo.term.ReplacedByClause(_parse_id(r)))
         for c in sorted(t.consider):
-            frame.append(fastobo.term.ConsiderClause(fastobo.id.parse(c)))
+            frame.append(fastobo.term.ConsiderClause(_parse_id(c)))
         return frame
 
     def _to_typedef_frame(self, r: RelationshipData):
-        frame = fastobo.typedef.TypedefFrame(fastobo.id.parse(r.id))
+        frame = fastobo.typedef.TypedefFrame(_parse_id(r.id))
         if r.anonymous:
             frame.append(fastobo.typedef.IsAnonymousClause(True))
         if r.name is not None:
             frame.append(fastobo.typedef.NameClause(r.name))
         if r.namespace is not None:
             if r.namespace != self.ont.metadata.default_namespace:
-                ns = fastobo.id.parse(r.namespace)
+                ns = _parse_id(r.namespace)
                 frame.append(fastobo.typedef.NamespaceClause(ns))
         for alt in sorted(r.alternate_ids):
-            frame.append(fastobo.typedef.AltIdClause(fastobo.id.parse(alt)))
+            frame.append(fastobo.typedef.AltIdClause(_parse_id(alt)))
         if r.definition is not None:
             frame.append(
                 fastobo.typedef.DefClause(
@@ -189,7 +197,7 @@ class FastoboSerializer:
         if r.comment is not None:
             frame.append(fastobo.typedef.CommentClause(r.comment))
         for subset in sorted(r.subsets):
-            frame.append(fastobo.typedef.SubsetClause(fastobo.id.parse(subset)))
+            frame.append(fastobo.typedef.SubsetClause(_parse_id(subset)))
         for syn in sorted(r.synonyms):
             frame.append(fastobo.typedef.SynonymClause(self._to_synonym(syn)))
         for xref in sorted(r.xrefs):
@@ -199,9 +207,9 @@ class FastoboSerializer:
                 fastobo.typedef.PropertyValueClause(self._to_property_value(pv))
             )
         if r.domain is not None:
-            frame.append(fastobo.typedef.DomainClause(fastobo.id.parse(r.domain)))
+            frame.append(fastobo.typedef.DomainClause(_parse_id(r.domain)))
         if r.range is not None:
-            frame.append(fastobo.typedef.RangeClause(fastobo.id.parse(r.range)))
+            frame.append(fastobo.typedef.RangeClause(_parse_id(r.range)))
         if r.builtin:
             frame.append(fastobo.typedef.BuiltinClause(True))
         for chain in sorted(r.holds_over_chain):
@@ -223,31 +231,29 @@ class FastoboSerializer:
         if r.inverse_functional:
             frame.append(fastobo.typedef.IsInverseFunctionalClause(True))
         for superclass in sorted(r.relationships.get("is_a", ())):
-            frame.append(fastobo.typedef.IsAClause(fastobo.id.parse(superclass)))
+            frame.append(fastobo.typedef.IsAClause(_parse_id(superclass)))
         for i in sorted(r.intersection_of):
-            frame.append(fastobo.typedef.IntersectionOfClause(fastobo.id.parse(i)))
+            frame.append(fastobo.typedef.IntersectionOfClause(_parse_id(i)))
         for id_ in sorted(r.union_of):
-            frame.append(fastobo.typedef.UnionOfClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.UnionOfClause(_parse_id(id_)))
         for id_ in sorted(r.equivalent_to):
-            frame.append(fastobo.typedef.EquivalentToClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.EquivalentToClause(_parse_id(id_)))
         for id_ in sorted(r.disjoint_from):
-            frame.append(fastobo.typedef.DisjointFromClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.DisjointFromClause(_parse_id(id_)))
         if r.inverse_of is not None:
-            frame.append(
-                fastobo.typedef.InverseOfClause(fastobo.id.parse(r.inverse_of))
-            )
+            frame.append(fastobo.typedef.InverseOfClause(_parse_id(r.inverse_of)))
         for id_ in sorted(r.transitive_over):
-            frame.append(fastobo.typedef.TransitiveOverClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.TransitiveOverClause(_parse_id(id_)))
         for chain in sorted(r.equivalent_to_chain):
-            c1, c2 = map(fastobo.id.parse, chain)
+            c1, c2 = map(_parse_id, chain)
             frame.append(fastobo.typedef.EquivalentToChainClause(c1, c2))
         for id_ in sorted(r.disjoint_over):
-            frame.append(fastobo.typedef.DisjointOverClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.DisjointOverClause(_parse_id(id_)))
         for rel, values in r.relationships.items():
             if rel != "is_a":
-                r_id = fastobo.id.parse(rel)
+                r_id = _parse_id(rel)
                 for value in values:
-                    t_id = fastobo.id.parse(value)
+                    t_id = _parse_id(value)
                     frame.append(fastobo.typedef.RelationshipClause(r_id, t_id))
         if r.obsolete:
             frame.append(fastobo.typedef.IsObsoleteClause(True))
@@ -256,9 +262,9 @@ class FastoboSerializer:
         if r.creation_date is not None:
             frame.append(fastobo.typedef.CreationDateClause(r.creation_date))
         for id_ in sorted(r.replaced_by):
-            frame.append(fastobo.typedef.ReplacedByClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.ReplacedByClause(_parse_id(id_)))
         for id_ in sorted(r.consider):
-            frame.append(fastobo.typedef.ConsiderClause(fastobo.id.parse(id_)))
+            frame.append(fastobo.typedef.ConsiderClause(_parse_id(id_)))
         for d in r.expand_assertion_to:
             frame.append(
                 fastobo.typedef.ExpandAssertionToClause(
@@ -278,4 +284,4 @@ class FastoboSerializer:
         return frame
 
     def _to_xref(self, x: Xref) -> fastobo.xref.Xref:
-        return fastobo.xref.Xref(fastobo.id.parse(x.id), x.description)
+        return fastobo.xref.Xref(_parse_id(x.id), x.description)
@@ -19,7 +19,6 @@ from typing import (
 )
 
 import frozendict
-import networkx
 
 from . import relationship
 from .entity import Entity, EntityData
@@ -96,25 +95,25 @@ class TermData(EntityData):  # noqa: R0902, R0903
         self.id = id
         self.anonymous = anonymous
         self.name = name
-        self.alternate_ids = alternate_ids or set()
+        self.alternate_ids = set() if alternate_ids is None else alternate_ids
         self.definition = definition
         self.comment = comment
-        self.synonyms = synonyms or set()
-        self.subsets = subsets or set()
+        self.synonyms = set() if synonyms is None else synonyms
+        self.subsets = set() if subsets is None else subsets
         self.namespace = namespace or None
-        self.xrefs = xrefs or set()
-        self.intersection_of = intersection_of or set()
-        self.union_of = union_of or set()
-        self.disjoint_from = disjoint_from or set()
-        self.relationships = relationships or dict()
+        self.xrefs = set() if xrefs is None else xrefs
+        self.intersection_of = set() if intersection_of is None else intersection_of
+        self.union_of = set() if union_of is None else union_of
+        self.disjoint_from = set() if disjoint_from is None else disjoint_from
+        self.relationships = dict() if relationships is None else relationships
         self.obsolete = obsolete
-        self.replaced_by = replaced_by or set()
-        self.consider = consider or set()
+        self.replaced_by = set() if replaced_by is None else replaced_by
+        self.consider = set() if consider is None else consider
         self.builtin = builtin
         self.created_by = created_by
         self.creation_date = creation_date
-        self.equivalent_to = equivalent_to or set()
-        self.annotations = annotations or set()
+        self.equivalent_to = set() if equivalent_to is None else equivalent_to
+        self.annotations = set() if annotations is None else annotations
 
 
 class Term(Entity):
@@ -129,6 +128,8 @@ class Term(Entity):
     `~Ontology.get_term` method.
     """
 
+    __slots__ = ()
+
     if typing.TYPE_CHECKING:
 
         def __init__(self, ontology: "Ontology", termdata: "TermData"):
@@ -159,19 +160,25 @@ class Term(Entity):
         if r._data() is relationship._BUILTINS["is_a"]:
             return self.superclasses()
 
+        import networkx
+
         g = networkx.MultiDiGraph()
         ont = self._ontology()
 
-        # Build the graph
+        # Build the graph in a single pass over the raw term data, without
+        # creating `Term` and `Relationship` views for every edge
+        backwards: Dict[str, Optional[str]] = {}
         for t in ont.terms():
             g.add_node(t.id)
-            for (rel, terms) in t.relationships.items():
+            for rel, terms in t._data().relationships.items():
+                if rel not in backwards:
+                    reldata = ont.get_relationship(rel)._data()
+                    backwards[rel] = rel if reldata.symmetric else reldata.inverse_of
+                backward = backwards[rel]
                 for t2 in terms:
-                    g.add_edge(t.id, t2.id, key=rel.id)
-                    if rel.symmetric:
-                        g.add_edge(t2.id, t.id, key=rel.id)
-                    elif rel.inverse_of is not None:
-                        g.add_edge(t2.id, t.id, key=rel.inverse_of.id)
+                    g.add_edge(t.id, t2, key=rel)
+                    if backward is not None:
+                        g.add_edge(t2, t.id, key=backward)
 
         # Search objects terms
         red, done = set(), set()
@@ -376,11 +383,10 @@ class Term(Entity):
     @property
     def relationships(self) -> Mapping[Relationship, FrozenSet["Term"]]:
         ont, termdata = self._ontology(), self._data()
+        get_term = ont.get_term
         return frozendict.frozendict(
             {
-                Relationship(ont, ont.get_relationship(rel)._data()): frozenset(
-                    Term(ont, ont.get_term(term)._data()) for term in terms
-                )
+                ont.get_relationship(rel): frozenset(map(get_term, terms))
                 for rel, terms in termdata.relationships.items()
             }
         )
@@ -459,6 +465,8 @@ class TermSet(MutableSet[Term]):
     """A specialized mutable set to store `Term` instances.
     """
 
+    __slots__ = ("__weakref__", "_ids", "_ontology")
+
     def __init__(self, terms: Optional[Iterable[Term]] = None) -> None:
         self._ids: Set[str] = set()
         self._ontology: "Optional[Ontology]" = None
@@ -479,7 +487,9 @@ class TermSet(MutableSet[Term]):
         return False
 
     def __iter__(self) -> Iterator[Term]:
-        return map(lambda t: self._ontology.get_term(t), iter(self._ids))
+        ontology = self._ontology
+        for id_ in self._ids:
+            yield ontology.get_term(id_)
 
     def __len__(self):
         return len(self._ids)
@@ -583,15 +593,16 @@ class TermSet(MutableSet[Term]):
 
     @property
     def ids(self) -> FrozenSet[str]:
-        return frozenset(map(operator.attrgetter("id"), iter(self)))
+        return frozenset(self._ids)
 
     @property
     def alternate_ids(self) -> FrozenSet[str]:
-        return frozenset(id for term in self for id in term.alternate_ids)
+        alternate_ids = map(operator.attrgetter("alternate_ids"), self)
+        return frozenset(itertools.chain.from_iterable(alternate_ids))
 
     @property
     def names(self) -> FrozenSet[str]:
-        return frozenset(map(operator.attrgetter("name"), iter(self)))
+        return frozenset(map(operator.attrgetter("name"), self))
 
     def subclasses(
         self, distance: Optional[int] = None, with_self: bool = True
@@ -4,13 +4,14 @@ import io
 import gzip
 import lzma
 import typing
-import urllib.request
 import warnings
-from http.client import HTTPResponse
 from typing import ByteString, BinaryIO, Dict, Union, Optional
 
 import chardet
 
+if typing.TYPE_CHECKING:
+    from http.client import HTTPResponse
+
 
 MAGIC_GZIP = bytearray([0x1F, 0x8B])
 MAGIC_LZMA = bytearray([0xFD, 0x37, 0x7A, 0x58, 0x5A, 0x00, 0x00])
@@ -70,9 +71,11 @@ def get_handle(path: str, timeout: int = 2) -> BinaryIO:
     try:
         return open(path, "rb", buffering=0)
     except Exception as err:
-        headers = {"Keep-Alive": f"timeout={timeout}"}
+        import urllib.request
+
+        headers = {"Keep-Alive": f"timeout={timeout}", "Accept-Encoding": "gzip"}
         request = urllib.request.Request(path, headers=headers)
-        res: HTTPResponse = urllib.request.urlopen(request, timeout=timeout)
+        res: "HTTPResponse" = urllib.request.urlopen(request, timeout=timeout)
         if not res.status == 200:
             raise ValueError(f"could not open {path}: {res.status} ({res.msg})")
         if res.headers.get("Content-Encoding") in {"gzip", "deflate"}:
@@ -58,6 +58,13 @@ class typechecked(object):
             return (isinstance(value, hint), hint.__name__)
         return (False, "something")
 
+    @staticmethod
+    @functools.lru_cache(maxsize=None)
+    def get_type_hints(func: Callable[..., object]) -> typing.Dict[str, object]:
+        # type hints of a function never change, so they can be memoized to
+        # avoid resolving forward references on each call of `func`
+        return typing.get_type_hints(func)
+
     def __init__(self, property: bool = False) -> None:
         self.property = property
 
@@ -67,7 +74,7 @@ class typechecked(object):
 
         @functools.wraps(func)
         def newfunc(*args, **kwargs):
-            hints = typing.get_type_hints(func)
+            hints = self.get_type_hints(func)
             callargs = inspect.getcallargs(func, *args, **kwargs)
             for name, value in callargs.items():
                 if name in hints:
@@ -1,8 +1,10 @@
+import gc
 import os
 import sys
 import pickle
 import unittest
 import warnings
+import weakref
 
 import pronto
 from pronto.logic.lineage import Lineage
@@ -42,6 +44,43 @@ class TestOntology(unittest.TestCase):
         t2.relationships = {}
         self.assertEqual(ont._inheritance, {t1.id: Lineage(), t2.id: Lineage()})
 
+    def test_inheritance_cache_isolated_term(self):
+        ont = pronto.Ontology()
+        t1 = ont.create_term("TST:001")
+        ont._build_inheritance_cache()
+        self.assertEqual(ont._inheritance, {t1.id: Lineage()})
+        self.assertTrue(t1.is_leaf())
+
+    def test_create_term_str_subclass(self):
+        class Id(str):
+            pass
+        ont = pronto.Ontology()
+        t1 = ont.create_term(Id("TST:001"))
+        self.assertEqual(t1.id, "TST:001")
+        self.assertIs(type(t1.id), str)
+        self.assertIn("TST:001", ont)
+        r1 = ont.create_relationship(Id("rel"))
+        self.assertEqual(r1.id, "rel")
+        self.assertIn("rel", ont)
+
+    @unittest.skipUnless(
+        sys.implementation.name == "cpython", "requires reference counting"
+    )
+    def test_collected_without_gc(self):
+        gc_enabled = gc.isenabled()
+        gc.disable()
+        try:
+            ont = pronto.Ontology()
+            t1 = ont.create_term("TST:001")
+            t2 = ont.create_term("TST:002")
+            t2.relationships = {ont["is_a"]: [t1]}
+            ref = weakref.ref(ont)
+            del ont, t1, t2
+            self.assertIs(ref(), None)
+        finally:
+            if gc_enabled:
+                gc.enable()
+
 
 class TestPickling(object):
     @classmethod
@@ -0,0 +1,83 @@
+import os
+import unittest
+import warnings
+from multiprocessing.pool import ThreadPool
+from unittest import mock
+
+import pronto
+from pronto.parsers import BaseParser
+
+from ..utils import DATADIR
+
+
+class TestProcessImports(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        warnings.simplefilter('error')
+        warnings.simplefilter('ignore', category=UnicodeWarning)
+
+    @classmethod
+    def tearDownClass(cls):
+        warnings.simplefilter(warnings.defaultaction)
+
+    @mock.patch.dict(os.environ, {"PRONTO_THREADS": "3"})
+    def test_imports(self):
+        ont = pronto.Ontology(os.path.join(DATADIR, "imports-main.obo"))
+        self.assertEqual(set(ont.imports), {"imports-a", "imports-b", "imports-c"})
+        self.assertEqual(
+            sorted(t.id for t in ont.terms()),
+            ["A:001", "B:001", "C:001", "MAIN:001"]
+        )
+        self.assertEqual(ont["B:001"].name, "term from b")
+        self.assertIn(ont["A:001"], ont["MAIN:001"].superclasses().to_set())
+
+    @mock.patch.dict(os.environ, {"PRONTO_THREADS": "2"})
+    def test_imports_nested(self):
+        with mock.patch("multiprocessing.pool.ThreadPool", wraps=ThreadPool) as tp:
+            ont = pronto.Ontology(os.path.join(DATADIR, "imports-nested.obo"))
+        self.assertEqual(tp.call_count, 1)
+        self.assertEqual(set(ont.imports), {"imports-main", "imports-c"})
+        self.assertEqual(
+            set(ont.imports["imports-main"].imports),
+            {"imports-a", "imports-b", "imports-c"},
+        )
+        self.assertIn(ont["A:001"], ont["NESTED:001"].superclasses().to_set())
+
+    @mock.patch.dict(os.environ, {"PRONTO_THREADS": "2"})
+    def test_imports_error(self):
+        with self.assertRaises(SyntaxError):
+            pronto.Ontology(os.path.join(DATADIR, "imports-broken.obo"))
+
+
+class TestGetThreads(unittest.TestCase):
+
+    def test_default(self):
+        with mock.patch.dict(os.environ):
+            os.environ.pop("PRONTO_THREADS", None)
+            self.assertEqual(BaseParser._get_threads(), min(os.cpu_count() or 1, 16))
+
+    @mock.patch.dict(os.environ, {"PRONTO_THREADS": "4"})
+    def test_override(self):
+        self.assertEqual(BaseParser._get_threads(), 4)
+
+    def test_invalid(self):
+        default = min(os.cpu_count() or 1, 16)
+        for value in ("abc", "0", "-2", ""):
+            with mock.patch.dict(os.environ, {"PRONTO_THREADS": value}):
+                with self.assertWarns(pronto.warnings.ProntoWarning):
+                    self.assertEqual(BaseParser._get_threads(), default)
+
+    @mock.patch.dict(os.environ, {"PRONTO_THREADS": "abc"})
+    def test_invalid_imports(self):
+        with self.assertWarns(pronto.warnings.ProntoWarning):
+            ont = pronto.Ontology(os.path.join(DATADIR, "imports-main.obo"))
+        self.assertEqual(set(ont.imports), {"imports-a", "imports-b", "imports-c"})
+
+    @mock.patch.dict(os.environ, {"PRONTO_THREADS": "abc"})
+    def test_invalid_no_imports(self):
+        with warnings.catch_warnings(record=True) as caught:
+            warnings.simplefilter("always")
+            pronto.Ontology(os.path.join(DATADIR, "imports-a.obo"))
+        categories = [w.category for w in caught]
+        self.assertNotIn(pronto.warnings.ProntoWarning, categories)
@@ -23,3 +23,9 @@ class TestRelationship(unittest.TestCase):
         """
         for r in RelationshipData.__slots__:
             self.assertTrue(hasattr(Relationship, r), f"no property for {r}")
+
+    def test_init_empty_containers(self):
+        xrefs, chain = set(), set()
+        data = RelationshipData("TST:rel", xrefs=xrefs, holds_over_chain=chain)
+        self.assertIs(data.xrefs, xrefs)
+        self.assertIs(data.holds_over_chain, chain)
@@ -49,10 +49,28 @@ class TestTerm(_TestTermMixin, unittest.TestCase):
         with self.assertRaises(ValueError):
             s = term.add_synonym('instrument type', type=st)
 
+    def test_objects(self):
+        part_of = self.ont.create_relationship("part_of")
+        part_of.transitive = self.has_part.transitive = True
+        part_of.inverse_of = self.has_part
+        adjacent_to = self.ont.create_relationship("adjacent_to")
+        adjacent_to.symmetric = True
+        self.t1.relationships = {part_of: {self.t2}, adjacent_to: {self.t3}}
+        self.t2.relationships = {part_of: {self.t3}}
+
+        self.assertSetEqual(set(self.t1.objects(part_of)), {self.t2, self.t3})
+        self.assertSetEqual(set(self.t3.objects(self.has_part)), {self.t1, self.t2})
+        self.assertSetEqual(set(self.t3.objects(adjacent_to)), {self.t1})
+        self.assertSetEqual(set(self.t2.objects(adjacent_to)), set())
+
     def test_properties(self):
         for t in TermData.__slots__:
             self.assertTrue(hasattr(Term, t), f"no property for {t}")
 
+    def test_slots(self):
+        self.assertFalse(hasattr(self.t1, "__dict__"))
+        self.assertFalse(hasattr(TermSet({self.t1}), "__dict__"))
+
     def test_subclasses(self):
         term = self.ms["MS:1003025"]
         self.assertSetEqual(
@@ -176,6 +194,15 @@ class TestTerm(_TestTermMixin, unittest.TestCase):
         self.assertEqual(repr(self.t1), f"Term({self.t1.id!r}, name={self.t1.name!r})")
 
 
+class TestTermData(unittest.TestCase):
+
+    def test_init_empty_containers(self):
+        relationships, xrefs = {}, set()
+        data = TermData("TST:001", relationships=relationships, xrefs=xrefs)
+        self.assertIs(data.relationships, relationships)
+        self.assertIs(data.xrefs, xrefs)
+
+
 class TestTermSet(_TestTermMixin, unittest.TestCase):
 
     def test_contains(self):
@@ -289,6 +316,13 @@ class TestTermSet(_TestTermMixin, unittest.TestCase):
             [self.t1.id, self.t2.id, self.t3.id]
         )
 
+    def test_iter(self):
+        s = TermSet({self.t1, self.t2})
+        self.assertEqual(sorted(t.id for t in s), [self.t1.id, self.t2.id])
+        pairs = sorted((x.id, y.id) for x in s for y in s)
+        self.assertEqual(len(pairs), 4)
+        self.assertEqual(list(TermSet()), [])
+
     def test_repr(self):
         s1 = TermSet({self.t1})
         self.assertEqual(repr(s1), f"TermSet({{Term({self.t1.id!r})}})")